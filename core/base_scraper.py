@@ -1,11 +1,28 @@
 import logging
+import re
 import time
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 from models.article import Article
 
+# Prefer the C-based lxml parser for BeautifulSoup; fall back to the stdlib one
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# JavaScript link forms, one named group per kind of target
+_JS_LINK_RE = re.compile(
+    r"fnDetailPopup\s*\(\s*['\"]?(?P<popup_id>\d+)['\"]?\s*\)"
+    r"|location\.href\s*=\s*['\"](?P<href>[^'\"]+)['\"]"
+    r"|open\s*\(\s*['\"](?P<open>[^'\"]+)['\"]"
+)
+
 class BaseScraper(ABC):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -14,7 +31,7 @@ class BaseScraper(ABC):
         self.session = self._create_session()
     
     def _create_session(self) -> requests.Session:
-        """Create requests session with proper headers"""
+        """Create pooled requests session with proper headers"""
         session = requests.Session()
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
@@ -22,26 +39,23 @@ class BaseScraper(ABC):
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
         }
         session.headers.update(headers)
+        # Keep connections alive across requests and retry transient failures
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
         return session
     
     def resolve_link(self, href: str, onclick: str = '') -> str:
         """Resolve JavaScript links like fnDetailPopup('12345')"""
-        import re
-        
-        # Check for JavaScript links
-        js_patterns = [
-            r"fnDetailPopup\s*\(\s*['\"]?(\d+)['\"]?\s*\)",
-            r"location\.href\s*=\s*['\"]([^'\"]+)['\"]",
-            r"open\s*\(\s*['\"]([^'\"]+)['\"]"
-        ]
-        
-        for pattern in js_patterns:
-            match = re.search(pattern, onclick)
-            if match:
-                article_id = match.group(1)
-                if 'fnDetailPopup' in onclick:
-                    return f"{self.base_url}/ArticleDetail.do?articleID={article_id}"
-                return urljoin(self.base_url, article_id)
+        match = _JS_LINK_RE.search(onclick) if onclick else None
+        if match:
+            if match.lastgroup == 'popup_id':
+                return f"{self.base_url}/ArticleDetail.do?articleID={match.group('popup_id')}"
+            return urljoin(self.base_url, match.group(match.lastgroup))
         
         # Handle regular links
         if href and href.startswith('javascript:'):
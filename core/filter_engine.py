@@ -4,13 +4,14 @@ Dynamic department filtering system for university admission announcements
 """
 import yaml
 import re
-from typing import List, Optional, Dict, Any, Set
+from typing import List, Optional, Dict, Any, Pattern, Sequence, Set, Tuple
 from pathlib import Path
 from datetime import datetime
 import logging
 from enum import Enum
 
-from models.article import Article, Department
+from models.article import Article, Department, DEPARTMENT_BY_VALUE
+from core.yaml_cache import load_yaml
 
 class MatchStrategy(Enum):
     """Strategy for matching articles to departments"""
@@ -47,6 +48,7 @@ class FilterEngine:
         
         # Load departments from config
         self.departments = self._load_departments()
+        self._index_keywords()
         
         # Load matching strategy from config
         matching_config = self.config_data.get('matching', {})
@@ -55,6 +57,9 @@ class FilterEngine:
         self.min_confidence = float(matching_config.get('min_confidence', 0.15))
         self.enable_fallback = matching_config.get('enable_fallback', True)
         
+        # Compiled EXACT/REGEX keyword patterns, keyed by (strategy, lowercased keyword)
+        self._pattern_cache: Dict[Tuple[MatchStrategy, str], Optional[Pattern[str]]] = {}
+        
         self.logger.info(f"Initialized FilterEngine with {len(self.departments)} departments")
     
     def _setup_logger(self):
@@ -71,8 +76,7 @@ class FilterEngine:
     def _load_config(self) -> Dict[str, Any]:
         """Load complete filter configuration from YAML"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml(self.config_path) or {}
         except Exception as e:
             self.logger.warning(f"Could not load config: {e}, using defaults")
             return {}
@@ -90,8 +94,7 @@ class FilterEngine:
             return self._create_default_config()
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(self.config_path)
             
             departments = config.get('departments', {})
             
@@ -253,7 +256,7 @@ class FilterEngine:
             
             confidence = self._calculate_match_confidence(
                 search_text,
-                dept_config['keywords'],
+                self._lowered_keywords.get(dept_id, ()),
                 dept_config.get('weight', 1.0)
             )
             
@@ -265,13 +268,13 @@ class FilterEngine:
             return max(matches, key=matches.get)
         
         return None
-    def _calculate_match_confidence(self, text: str, keywords: List[str], weight: float = 1.0) -> float:
+    def _calculate_match_confidence(self, text: str, keywords: Sequence[str], weight: float = 1.0) -> float:
         """
         Calculate match confidence score
         
         Args:
-            text: Text to search in
-            keywords: List of keywords to match
+            text: Lowercased text to search in
+            keywords: Lowercased keywords to match
             weight: Department weight multiplier
             
         Returns:
@@ -283,23 +286,15 @@ class FilterEngine:
         matches = 0
         total_keywords = len(keywords)
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower()
-            
-            if self.match_strategy == MatchStrategy.EXACT:
-                # Exact word match (with word boundaries)
-                pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-                if re.search(pattern, text):
-                    matches += 1
-            elif self.match_strategy == MatchStrategy.REGEX:
-                # Regex match
-                try:
-                    if re.search(keyword_lower, text):
+        for keyword_lower in keywords:
+            if self.match_strategy in (MatchStrategy.EXACT, MatchStrategy.REGEX):
+                pattern = self._get_pattern(keyword_lower)
+                if pattern is not None:
+                    if pattern.search(text):
                         matches += 1
-                except re.error:
+                elif keyword_lower in text:
                     # Fallback to contains if regex is invalid
-                    if keyword_lower in text:
-                        matches += 1
+                    matches += 1
             else:  # CONTAINS (default)
                 # Simple substring match
                 if keyword_lower in text:
@@ -313,6 +308,43 @@ class FilterEngine:
         
         return confidence
     
+    def _index_keywords(self):
+        """Cache each department's keywords lowercased, so matching doesn't redo it per article"""
+        self._lowered_keywords: Dict[str, Tuple[str, ...]] = {
+            dept_id: tuple(keyword.lower() for keyword in dept_config['keywords'])
+            for dept_id, dept_config in self.departments.items()
+        }
+    
+    def _get_pattern(self, keyword_lower: str) -> Optional[Pattern[str]]:
+        """
+        Return the compiled pattern for a keyword under the current strategy
+        
+        Patterns are compiled once per keyword and reused across articles.
+        
+        Args:
+            keyword_lower: Lowercased keyword
+            
+        Returns:
+            Compiled pattern, or None if the keyword is not a valid regex
+        """
+        key = (self.match_strategy, keyword_lower)
+        try:
+            return self._pattern_cache[key]
+        except KeyError:
+            pass
+        
+        if self.match_strategy == MatchStrategy.EXACT:
+            # Exact word match (with word boundaries)
+            pattern = re.compile(r'\b' + re.escape(keyword_lower) + r'\b')
+        else:
+            try:
+                pattern = re.compile(keyword_lower)
+            except re.error:
+                pattern = None
+        
+        self._pattern_cache[key] = pattern
+        return pattern
+    
     def add_department(self, dept_id: str, name: str, keywords: List[str], 
                       emoji: str = "🎓", priority: int = 99, enabled: bool = True) -> bool:
         """
@@ -344,6 +376,7 @@ class FilterEngine:
         }
         
         self.departments[dept_id] = new_department
+        self._index_keywords()
         
         # Save updated configuration
         self._save_config({'departments': self.departments})
@@ -370,6 +403,7 @@ class FilterEngine:
         for key, value in kwargs.items():
             if key in self.departments[dept_id]:
                 self.departments[dept_id][key] = value
+        self._index_keywords()
         
         # Save updated configuration
         self._save_config({'departments': self.departments})
@@ -423,12 +457,12 @@ class FilterEngine:
         
         if dept_id:
             # Convert string department to Department enum
-            try:
-                article.department = Department(dept_id)
+            department = DEPARTMENT_BY_VALUE.get(dept_id)
+            if department is not None:
+                article.department = department
                 self.logger.debug(f"Assigned department '{dept_id}' to article: {article.title[:50]}...")
                 return dept_id
-            except ValueError:
-                self.logger.warning(f"Unknown department: {dept_id}")
+            self.logger.warning(f"Unknown department: {dept_id}")
         
         # Fallback to general if enabled
         if self.enable_fallback:
@@ -441,6 +475,7 @@ class FilterEngine:
         """Reload configuration from file"""
         self.logger.info("Reloading filter configuration")
         self.departments = self._load_departments()
+        self._index_keywords()
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -2,12 +2,14 @@
 """
 University Admission Monitor - Main Engine
 """
-import yaml
+import html
 import logging
+import re
 import sqlite3
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import sys
 import os
 
@@ -15,19 +17,35 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.article import Article
+from core.yaml_cache import load_yaml
 from notifiers.telegram_notifier import TelegramNotifier
 
+# Anything Telegram won't accept inside a hashtag (it allows letters, digits and _)
+_HASHTAG_INVALID_RE = re.compile(r'\W+')
+
+# Telegram rejects messages over 4096 characters; leave headroom for the separators
+MAX_MESSAGE_CHARS = 4000
+MESSAGE_SEPARATOR = "\n\n━━━━━\n\n"
+
+def to_hashtag(text: str) -> str:
+    """Strip characters that would cut a Telegram hashtag short, e.g. 'Saramin Jobs' -> 'SaraminJobs'"""
+    return _HASHTAG_INVALID_RE.sub('', text)
+
 class MonitorEngine:
-    def __init__(self, config_path: str = "config/config.yaml"):
+    def __init__(self, config_path: str = "config/config.yaml", max_workers: Optional[int] = None):
         self.config = self.load_config(config_path)
+        # Upper bound on scrapers run at once; an explicit argument wins over the config
+        if max_workers is None:
+            max_workers = self.config.get('monitoring', {}).get('max_workers', 4)
+        # ThreadPoolExecutor rejects 0, so always allow at least one scraper
+        self.max_workers = max(1, max_workers)
         self.setup_logging()
         self.telegram = TelegramNotifier(self.config['telegram'])
         self.db_path = self.config['database']['path']
         self.setup_database()
         
     def load_config(self, config_path: str) -> dict:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_yaml(config_path)
     
     def setup_logging(self):
         log_config = self.config['logging']
@@ -43,8 +61,12 @@ class MonitorEngine:
     
     def setup_database(self):
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # One connection for the whole run instead of reconnecting per article
+        self.conn = sqlite3.connect(self.db_path)
+        # WAL lets readers run alongside the writer; NORMAL skips the fsync per commit
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        cursor = self.conn.cursor()
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS articles (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -56,41 +78,67 @@ class MonitorEngine:
             sent_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         ''')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_hash ON articles (hash)')
-        conn.commit()
-        conn.close()
+        # hash is UNIQUE, so SQLite already maintains an index for it
+        cursor.execute('DROP INDEX IF EXISTS idx_hash')
+        self.conn.commit()
+    
+    def close(self):
+        """Close the database connection and the Telegram session"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self.telegram.close()
     
     def is_duplicate(self, article_hash: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT 1 FROM articles WHERE hash = ?', (article_hash,))
-        result = cursor.fetchone()
-        conn.close()
-        return result is not None
+        cursor = self.conn.execute('SELECT 1 FROM articles WHERE hash = ?', (article_hash,))
+        return cursor.fetchone() is not None
+    
+    def sent_hashes(self, hashes: List[str]) -> set:
+        """Return the subset of hashes already recorded, in as few queries as possible"""
+        found = set()
+        # Stay well under SQLite's bound-parameter limit
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = self.conn.execute(f'SELECT hash FROM articles WHERE hash IN ({placeholders})', chunk)
+            found.update(row[0] for row in cursor)
+        return found
     
     def mark_as_sent(self, article: Article):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
         try:
-            cursor.execute('''
+            self.conn.execute('''
             INSERT OR IGNORE INTO articles (hash, title, url, source, department)
             VALUES (?, ?, ?, ?, ?)
             ''', (article.get_hash(), article.title, article.url, article.source, article.department))
-            conn.commit()
+            self.conn.commit()
             self.logger.debug(f"Marked as sent: {article.title}")
         except Exception as e:
             self.logger.error(f"Error marking article: {e}")
-        finally:
-            conn.close()
+    
+    def mark_all_as_sent(self, articles: List[Article]):
+        """Record a batch of articles in a single transaction"""
+        rows = [
+            (article.get_hash(), article.title, article.url, article.source, article.department)
+            for article in articles
+        ]
+        try:
+            with self.conn:
+                self.conn.executemany('''
+                INSERT OR IGNORE INTO articles (hash, title, url, source, department)
+                VALUES (?, ?, ?, ?, ?)
+                ''', rows)
+            self.logger.debug(f"Marked {len(rows)} articles as sent")
+        except Exception as e:
+            self.logger.error(f"Error marking articles: {e}")
     
     def load_filters(self) -> tuple:
-        with open('config/filters.yaml', 'r') as f:
-            filters_config = yaml.safe_load(f)
+        filters_config = load_yaml('config/filters.yaml')
         global_min = filters_config.get('matching', {}).get('min_confidence', 0.10)
         keywords = {}
         configs = {}
         for dept, config in filters_config.get('departments', {}).items():
-            keywords[dept] = config.get('keywords', [])
+            # Lowercase once here rather than per article in filter_article
+            keywords[dept] = tuple(kw.lower() for kw in config.get('keywords', []))
             configs[dept] = {
                 'threshold': config.get('confidence_threshold', global_min),
                 'priority': config.get('priority', 99)
@@ -103,7 +151,7 @@ class MonitorEngine:
         
         matches = {}
         for dept, keywords in filters.items():
-            keyword_matches = sum(1 for kw in keywords if kw.lower() in text_to_check)
+            keyword_matches = sum(1 for kw in keywords if kw in text_to_check)
             min_required = 2
             if keyword_matches >= min_required:
                 matches[dept] = {
@@ -123,21 +171,56 @@ class MonitorEngine:
         if len(content) > 250:
             content = content[:247] + "..."
 
-        message = f"""🎓 <b>[새 입학 공고] {article.title}</b>
+        # Sent with parse_mode=HTML: one stray & or < would get the whole batch rejected
+        message = f"""🎓 <b>[새 입학 공고] {html.escape(article.title)}</b>
 
-📌 <b>부서/학과</b>: {department}
-🔗 <a href="{article.url}">기사 보기</a>
+📌 <b>부서/학과</b>: {html.escape(department)}
+🔗 <a href="{html.escape(article.url)}">기사 보기</a>
 
 <b>💡 URL 확인 - 열기:</b>
 뉴스 링크 찾고 - 길게 누르고 - '다음으로 열기'
 
-#대학입시 #{department}"""
+#대학입시 #{to_hashtag(department)}"""
         return message.strip()
     
+    def batch_messages(self, messages: List[str]) -> List[Tuple[str, int]]:
+        """
+        Pack messages greedily into as few chunks of at most MAX_MESSAGE_CHARS as possible
+        
+        Returns (chunk text, number of messages in it) pairs.
+        """
+        chunks = []
+        current = []
+        current_len = 0
+        for message in messages:
+            added = len(message) + (len(MESSAGE_SEPARATOR) if current else 0)
+            if current and current_len + added > MAX_MESSAGE_CHARS:
+                chunks.append((MESSAGE_SEPARATOR.join(current), len(current)))
+                current, current_len = [], 0
+                added = len(message)
+            current.append(message)
+            current_len += added
+        if current:
+            chunks.append((MESSAGE_SEPARATOR.join(current), len(current)))
+        return chunks
+    
+    def group_messages(self, articles: List[Article]) -> List[tuple]:
+        """Return (department, message chunk, article count) per outgoing Telegram message"""
+        # Messages are routed to a topic by department, so only batch within one department
+        by_department: Dict[str, List[Article]] = {}
+        for article in articles:
+            by_department.setdefault(article.department, []).append(article)
+        
+        outgoing = []
+        for department, dept_articles in by_department.items():
+            messages = [self.format_message(article, department) for article in dept_articles]
+            for chunk, count in self.batch_messages(messages):
+                outgoing.append((department, chunk, count))
+        return outgoing
+    
     def test_scraping(self) -> List[Article]:
         self.logger.info("=== TEST MODE: Scraping without notifications ===")
-        with open('config/sources.yaml', 'r') as f:
-            sources_config = yaml.safe_load(f)
+        sources_config = load_yaml('config/sources.yaml')
         articles = []
         if 'adiga' in sources_config.get('sources', {}):
             from scrapers.adiga_scraper import AdigaScraper
@@ -152,6 +235,12 @@ class MonitorEngine:
                     self.logger.info(f"    Content preview: {article.content[:100]}...")
         return articles
     
+    def _scrape_one(self, scraper) -> List[Article]:
+        self.logger.info(f"Scraping from {scraper.get_source_name()}")
+        articles = scraper.scrape()
+        self.logger.info(f"Found {len(articles)} articles from {scraper.get_source_name()}")
+        return articles
+    
     def run(self, test_mode: bool = False):
         self.logger.info("Starting University Admission Monitor")
         
@@ -161,8 +250,7 @@ class MonitorEngine:
         
         self.logger.info("Telegram connection successful")
         
-        with open('config/sources.yaml', 'r') as f:
-            sources_config = yaml.safe_load(f)
+        sources_config = load_yaml('config/sources.yaml')
         
         filters, configs, min_conf = self.load_filters()
         
@@ -174,40 +262,48 @@ class MonitorEngine:
             self.logger.error("No scrapers configured or enabled")
             return
         
+        # Scrapers spend their time waiting on the network/browser, so run them side by side.
+        # map() keeps results in scraper order, which keeps dedup deterministic.
         all_articles = []
-        for scraper in scrapers:
-            self.logger.info(f"Scraping from {scraper.get_source_name()}")
-            articles = scraper.scrape()
-            all_articles.extend(articles)
-            self.logger.info(f"Found {len(articles)} articles from {scraper.get_source_name()}")
+        with ThreadPoolExecutor(max_workers=min(len(scrapers), self.max_workers)) as executor:
+            for articles in executor.map(self._scrape_one, scrapers):
+                all_articles.extend(articles)
         
-        new_articles = []
+        candidates = []
         for article in all_articles:
             department = self.filter_article(article, filters, configs, min_conf)
             if department == "general":
                 self.logger.debug(f"Skipping article with no department match: {article.title}")
                 continue
             article.department = department
-            if not self.is_duplicate(article.get_hash()):
-                new_articles.append(article)
-                self.mark_as_sent(article)
+            candidates.append((article.get_hash(), article))
+        
+        # One lookup for the whole batch instead of a query per article
+        seen = self.sent_hashes([article_hash for article_hash, _ in candidates])
+        new_articles = []
+        for article_hash, article in candidates:
+            if article_hash in seen:
+                continue
+            # Also catches the same article scraped twice in this run
+            seen.add(article_hash)
+            new_articles.append(article)
+        self.mark_all_as_sent(new_articles)
+        
+        # Several articles per message keeps a busy cycle under Telegram's per-chat rate limit
+        outgoing = self.group_messages(new_articles)
         
         if test_mode:
-            self.logger.info(f"TEST MODE: Would send {len(new_articles)} notifications")
-            for article in new_articles:
-                message = self.format_message(article, article.department)
-                self.logger.info(f"Would send:\n{message}\n")
+            self.logger.info(f"TEST MODE: Would send {len(new_articles)} articles in {len(outgoing)} messages")
+            for department, message, count in outgoing:
+                self.logger.info(f"Would send ({department}, {count} articles):\n{message}\n")
         else:
-            if new_articles:
-                self.logger.info(f"Sending {len(new_articles)} notifications")
-                for article in new_articles:
-                    message = self.format_message(article, article.department)
-                    if self.telegram.send_message(message, department=article.department):
-                        self.logger.info(f"Notification sent: {article.title}")
+            if outgoing:
+                self.logger.info(f"Sending {len(new_articles)} articles in {len(outgoing)} messages")
+                for department, message, count in outgoing:
+                    if self.telegram.send_message(message, department=department):
+                        self.logger.info(f"Notification sent: {count} articles for {department}")
                     else:
-                        self.logger.error(f"Failed to send: {article.title}")
-                    import time
-                    time.sleep(1)
+                        self.logger.error(f"Failed to send: {count} articles for {department}")
             else:
                 self.logger.info("No new articles to notify")
         
@@ -218,13 +314,32 @@ def main():
     parser = argparse.ArgumentParser(description='University Admission Monitor')
     parser.add_argument('--test', action='store_true', help='Test mode (no notifications)')
     parser.add_argument('--scrape-test', action='store_true', help='Test scraping only')
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help='Maximum number of scrapers to run concurrently')
+    parser.add_argument('--profile', nargs='?', const='profile.prof', metavar='FILE',
+                        help='Profile the run with cProfile and write stats to FILE (default: profile.prof)')
     args = parser.parse_args()
-    monitor = MonitorEngine()
-    if args.scrape_test:
-        articles = monitor.test_scraping()
-        print(f"\nTotal articles found: {len(articles)}")
-    else:
-        monitor.run(test_mode=args.test)
+    monitor = MonitorEngine(max_workers=args.workers)
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        if args.scrape_test:
+            articles = monitor.test_scraping()
+            print(f"\nTotal articles found: {len(articles)}")
+        else:
+            monitor.run(test_mode=args.test)
+    finally:
+        monitor.close()
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            # Cumulative time shows whether the run waits on the network or computes
+            import pstats
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+            print(f"Profile written to {args.profile} (inspect with: python -m pstats {args.profile})")
 
 if __name__ == "__main__":
     main()
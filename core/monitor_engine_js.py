@@ -2,92 +2,27 @@
 """
 Monitor engine with JavaScript support
 """
-import yaml
-import logging
-import sqlite3
-import hashlib
-from datetime import datetime
-from typing import List, Dict, Any
 import sys
 import os
+from typing import List, Dict
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.article import Article
+from core.yaml_cache import load_yaml
+from core.monitor_engine import MonitorEngine, to_hashtag
 from scrapers.adiga_js_scraper import AdigaJsScraper
-from notifiers.telegram_notifier import TelegramNotifier
 
-class JsMonitorEngine:
-    def __init__(self, config_path: str = "config/config.yaml"):
-        self.config = self.load_config(config_path)
-        self.setup_logging()
-        self.telegram = TelegramNotifier(self.config['telegram'])
-        self.db_path = self.config['database']['path']
-        self.setup_database()
-        
-    def load_config(self, config_path: str) -> dict:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+class JsMonitorEngine(MonitorEngine):
+    """
+    MonitorEngine variant that scrapes Adiga through the JavaScript scraper
     
-    def setup_logging(self):
-        log_config = self.config['logging']
-        logging.basicConfig(
-            level=log_config['level'],
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_config['file']),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
-    
-    def setup_database(self):
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            hash TEXT UNIQUE NOT NULL,
-            title TEXT NOT NULL,
-            url TEXT NOT NULL,
-            source TEXT NOT NULL,
-            department TEXT,
-            sent_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-        ''')
-        
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_hash ON articles (hash)')
-        conn.commit()
-        conn.close()
-    
-    def is_duplicate(self, article_hash: str) -> bool:
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT 1 FROM articles WHERE hash = ?', (article_hash,))
-        result = cursor.fetchone()
-        conn.close()
-        return result is not None
-    
-    def mark_as_sent(self, article: Article):
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-            INSERT OR IGNORE INTO articles (hash, title, url, source, department)
-            VALUES (?, ?, ?, ?, ?)
-            ''', (article.get_hash(), article.title, article.url, article.source, article.department))
-            conn.commit()
-        except Exception as e:
-            self.logger.error(f"Error marking article: {e}")
-        finally:
-            conn.close()
+    Config, logging, the database connection and dedup all come from
+    MonitorEngine; only filtering, formatting and scraper selection differ.
+    """
     
     def load_filters(self) -> Dict[str, List[str]]:
-        with open('config/filters.yaml', 'r') as f:
-            filters = yaml.safe_load(f)
+        filters = load_yaml('config/filters.yaml')
         
         department_filters = {}
         for dept, config in filters.get('departments', {}).items():
@@ -121,7 +56,7 @@ class JsMonitorEngine:
 <b>링크:</b> {article.url}
 
 <b>출처:</b> {article.source}
-#{department} #{article.source}
+#{to_hashtag(department)} #{to_hashtag(article.source)}
 """
         return message.strip()
     
@@ -136,8 +71,7 @@ class JsMonitorEngine:
         self.logger.info("Telegram connection successful")
         
         # Load configs
-        with open('config/sources.yaml', 'r') as f:
-            sources_config = yaml.safe_load(f)
+        sources_config = load_yaml('config/sources.yaml')
         
         department_filters = self.load_filters()
         
@@ -162,14 +96,19 @@ class JsMonitorEngine:
             self.logger.info(f"Found {len(articles)} articles from {scraper.get_source_name()}")
         
         # Filter and process
-        new_articles = []
+        candidates = []
         for article in all_articles:
-            department = self.filter_article(article, department_filters)
-            article.department = department
-            
-            if not self.is_duplicate(article.get_hash()):
-                new_articles.append(article)
-                self.mark_as_sent(article)
+            article.department = self.filter_article(article, department_filters)
+            candidates.append((article.get_hash(), article))
+        
+        seen = self.sent_hashes([article_hash for article_hash, _ in candidates])
+        new_articles = []
+        for article_hash, article in candidates:
+            if article_hash in seen:
+                continue
+            seen.add(article_hash)
+            new_articles.append(article)
+        self.mark_all_as_sent(new_articles)
         
         # Send notifications
         if test_mode:
@@ -186,9 +125,6 @@ class JsMonitorEngine:
                         self.logger.info(f"Notification sent: {article.title}")
                     else:
                         self.logger.error(f"Failed to send: {article.title}")
-                    
-                    import time
-                    time.sleep(1)
             else:
                 self.logger.info("No new articles to notify")
         
@@ -203,7 +139,10 @@ def main():
     args = parser.parse_args()
     
     monitor = JsMonitorEngine()
-    monitor.run(test_mode=args.test)
+    try:
+        monitor.run(test_mode=args.test)
+    finally:
+        monitor.close()
 
 if __name__ == "__main__":
     main()
@@ -10,6 +10,7 @@ import yaml
 import logging
 
 from core.base_scraper import BaseScraper
+from core.yaml_cache import load_yaml
 
 class ScraperFactory:
     """
@@ -43,6 +44,10 @@ class ScraperFactory:
         # Cache for instantiated scrapers
         self._scraper_cache: Dict[str, BaseScraper] = {}
         
+        # Resolved scraper classes keyed by their scraper_class name, so each
+        # module is imported and scanned once however many sources share it
+        self._class_registry: Dict[str, Type[BaseScraper]] = {}
+        
         # Health tracking
         self.scraper_health: Dict[str, Dict[str, Any]] = {}
         
@@ -81,8 +86,7 @@ class ScraperFactory:
             raise FileNotFoundError(error_msg)
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml(config_path)
             
             if not config:
                 self.logger.warning(f"Configuration file is empty: {config_path}")
@@ -238,6 +242,39 @@ class ScraperFactory:
             self.logger.warning(f"No valid scraper class found in module")
             return None
     
+    def _resolve_scraper_class(self, scraper_class_name: str) -> Optional[Type[BaseScraper]]:
+        """
+        Look up a scraper class, importing its module on first use
+        
+        Args:
+            scraper_class_name: scraper_class value from the source configuration
+            
+        Returns:
+            Scraper class or None if it cannot be loaded
+        """
+        scraper_class = self._class_registry.get(scraper_class_name)
+        if scraper_class:
+            return scraper_class
+        
+        # Construct module name
+        module_name = f"scrapers.{scraper_class_name.lower()}"
+        
+        # Import module
+        module = self._import_scraper_module(module_name)
+        if not module:
+            # Try alternative naming (without .py extension issues)
+            module_name_alt = f"scrapers.{scraper_class_name}"
+            module = self._import_scraper_module(module_name_alt)
+            if not module:
+                self.logger.error(f"Failed to import scraper module: {scraper_class_name}")
+                return None
+        
+        # Discover scraper class
+        scraper_class = self._discover_scraper_class(module, scraper_class_name)
+        if scraper_class:
+            self._class_registry[scraper_class_name] = scraper_class
+        return scraper_class
+    
     def create_scraper(self, source_id: str, force_reload: bool = False) -> Optional[BaseScraper]:
         """
         Create scraper instance for given source
@@ -271,21 +308,7 @@ class ScraperFactory:
             self.logger.error(f"No scraper_class specified for {source_id}")
             return None
         
-        # Construct module name
-        module_name = f"scrapers.{scraper_class_name.lower()}"
-        
-        # Import module
-        module = self._import_scraper_module(module_name)
-        if not module:
-            # Try alternative naming (without .py extension issues)
-            module_name_alt = f"scrapers.{scraper_class_name}"
-            module = self._import_scraper_module(module_name_alt)
-            if not module:
-                self.logger.error(f"Failed to import scraper module for {source_id}")
-                return None
-        
-        # Discover scraper class
-        scraper_class = self._discover_scraper_class(module, scraper_class_name)
+        scraper_class = self._resolve_scraper_class(scraper_class_name)
         if not scraper_class:
             self.logger.error(f"Failed to find valid scraper class for {source_id}")
             return None
@@ -454,6 +477,9 @@ class ScraperFactory:
         
         self.sources_config['sources'][source_id] = config
         
+        # Resolve straight to the given class instead of searching scrapers/
+        self._class_registry[config.get('scraper_class', scraper_class.__name__)] = scraper_class
+        
         # Clear cache for this source
         if source_id in self._scraper_cache:
             del self._scraper_cache[source_id]
@@ -3,11 +3,17 @@
 URL Validator and Corrector for ensuring Telegram links actually work
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, urljoin, parse_qs, urlencode
 import logging
 from typing import Dict, Any, Optional, Tuple
 import re
 
+# Absolute adiga article/news links found in a page
+_ADIGA_ARTICLE_LINK_RE = re.compile(r'href=[\"\'](https?://[^\"\']*adiga[^\"\']*(?:article|news)[^\"\']*)[\"\']', re.IGNORECASE)
+
 class URLValidator:
     """Validates and corrects URLs to ensure they work in Telegram"""
     
@@ -20,6 +26,14 @@ class URLValidator:
             'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
             'Accept-Encoding': 'gzip, deflate, br',
         })
+        # Reuse connections across checks; sized for the concurrent alternative probes
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.logger = logging.getLogger("url_validator")
     
     def validate_adiga_url(self, url: str) -> Dict[str, Any]:
@@ -103,6 +117,14 @@ class URLValidator:
         
         return result
     
+    def _probe_url(self, url: str) -> bool:
+        """Return True if a HEAD request to the URL answers 200"""
+        try:
+            resp = self.session.head(url, timeout=5, allow_redirects=True)
+            return resp.status_code == 200
+        except:
+            return False
+    
     def _try_correct_adiga_url(self, original_url: str, page_content: str) -> Optional[str]:
         """
         Try to find a better URL pattern for adiga.kr articles
@@ -111,6 +133,7 @@ class URLValidator:
             Corrected URL or None if no correction found
         """
         parsed = urlparse(original_url)
+        article_id = ''
         
         # Pattern 1: Try with different parameter formats
         if 'prtlBbsId' in original_url:
@@ -129,21 +152,16 @@ class URLValidator:
                     f"https://m.adiga.kr/news/{article_id}",
                 ]
                 
-                # Check each alternative
-                for alt_url in alternatives:
-                    try:
-                        resp = self.session.head(alt_url, timeout=5, allow_redirects=True)
-                        if resp.status_code == 200:
+                # Probe all alternatives at once, keeping the priority order above
+                with ThreadPoolExecutor(max_workers=len(alternatives)) as executor:
+                    results = executor.map(self._probe_url, alternatives)
+                    for alt_url, ok in zip(alternatives, results):
+                        if ok:
                             return alt_url
-                    except:
-                        continue
         
         # Pattern 2: Look for article links in the page
-        article_links = re.findall(r'href=[\"\'](https?://[^\"\']*adiga[^\"\']*article[^\"\']*)[\"\']', page_content, re.IGNORECASE)
-        article_links += re.findall(r'href=[\"\'](https?://[^\"\']*adiga[^\"\']*news[^\"\']*)[\"\']', page_content, re.IGNORECASE)
-        
-        for link in article_links:
-            if 'prtlBbsId' in link and article_id in link:
+        for link in _ADIGA_ARTICLE_LINK_RE.findall(page_content):
+            if article_id and 'prtlBbsId' in link and article_id in link:
                 return link
         
         return None
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Cached YAML loading for configuration files
+"""
+import copy
+import os
+from collections import OrderedDict
+from typing import Any, Tuple
+
+import yaml
+
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Maximum number of parsed files kept in memory
+MAX_ENTRIES = 100
+
+# path -> (mtime_ns, size, parsed data)
+_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+
+
+def load_yaml(path) -> Any:
+    """
+    Load a YAML file, reusing the parsed result while the file is unchanged
+
+    The cache is keyed by path and validated against the file's mtime and
+    size, so edits are picked up on the next call. Callers get a deep copy
+    and may mutate the result freely.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the file has syntax errors
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+
+    cached = _CACHE.get(key)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    with open(key, 'rb') as f:
+        data = yaml.load(f, Loader=SafeLoader)
+
+    _CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _CACHE.move_to_end(key)
+    if len(_CACHE) > MAX_ENTRIES:
+        _CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+def clear_cache():
+    """Drop all cached files"""
+    _CACHE.clear()
@@ -2,21 +2,15 @@
 UNIVERSITY DEADLINE TRACKER - ONE-SHOT
 Runs on Wednesdays, sends weekly deadline report to Education & Training topic
 """
-import yaml
-import requests
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from operator import attrgetter
+from datetime import date, datetime, timedelta
 import sys
 import os
+from typing import NamedTuple
 
-# Load config
-with open('config/config.yaml', 'r') as f:
-    config = yaml.safe_load(f)
-
-BOT_TOKEN = config['telegram']['bot_token']
-GROUP_ID = config['telegram']['group_id']
-
-# Get topic ID for Education & Training (admissions)
-TOPIC_ID = config['telegram']['topics'].get('admissions', None)
+CONFIG_PATH = 'config/config.yaml'
+WEDNESDAY = 2
 
 DEADLINES = [
     ["Spring 2026 추가모집", "2026-02-10", "추가모집 공고 시작", 1, "추가모집"],
@@ -29,54 +23,81 @@ DEADLINES = [
     ["Spring 2027 정시모집 시작", "2026-11-01", "Spring 2027 정시모집 접수 시작", 2, "정시모집"],
 ]
 
-def calculate_days_remaining(target_date_str):
-    try:
-        today = datetime.now().date()
-        target = datetime.strptime(target_date_str, "%Y-%m-%d").date()
-        return (target - today).days
-    except:
-        return None
+_WEEKDAY_KO = ("월", "화", "수", "목", "금", "토", "일")
+
+class Deadline(NamedTuple):
+    """A tracked deadline with the days left until it"""
+    name: str
+    date: str
+    days: int
+    desc: str
+    priority: int
+    category: str
+
+# Upper bounds (inclusive, in days) of the urgent and upcoming buckets; anything later is future
+PRIORITY_THRESHOLDS = (21, 56)
+
+def _validate_deadlines():
+    """Fail loudly on a malformed entry instead of silently skipping it"""
+    for name, date_str, *_ in DEADLINES:
+        try:
+            date.fromisoformat(date_str)
+        except ValueError as e:
+            raise ValueError(f"Invalid date for deadline {name!r}: {date_str}") from e
 
-def categorize_deadlines():
+_validate_deadlines()
+
+def calculate_days_remaining(target_date_str, today=None):
+    if today is None:
+        today = date.today()
+    return (date.fromisoformat(target_date_str) - today).days
+
+def categorize_deadlines(today=None):
     top_priority = []
     medium_priority = []
     future_deadlines = []
+    buckets = (top_priority, medium_priority, future_deadlines)
+    
+    if today is None:
+        today = date.today()
     
     for name, date_str, desc, base_priority, category in DEADLINES:
-        days_left = calculate_days_remaining(date_str)
+        days_left = calculate_days_remaining(date_str, today)
         
-        if days_left is None or days_left < 0:
+        if days_left < 0:
             continue
         
-        deadline_info = {
-            'name': name,
-            'date': date_str,
-            'days': days_left,
-            'desc': desc,
-            'priority': base_priority,
-            'category': category
-        }
-        
-        if days_left <= 21:
-            top_priority.append(deadline_info)
-        elif days_left <= 56:
-            medium_priority.append(deadline_info)
-        else:
-            future_deadlines.append(deadline_info)
+        deadline = Deadline(name, date_str, days_left, desc, base_priority, category)
+        buckets[bisect_left(PRIORITY_THRESHOLDS, days_left)].append(deadline)
     
     return top_priority, medium_priority, future_deadlines
 
+def load_telegram_config(config_path=CONFIG_PATH):
+    """Return (bot_token, group_id, topic_id) from config.yaml"""
+    import yaml
+    
+    with open(config_path, 'r') as f:
+        config = yaml.safe_load(f)
+    
+    telegram = config['telegram']
+    # Topic ID for Education & Training (admissions)
+    return telegram['bot_token'], telegram['group_id'], telegram['topics'].get('admissions', None)
+
 def send_deadline_alert(message):
-    url = f"https://api.telegram.org/bot{BOT_TOKEN}/sendMessage"
+    import requests
+    
+    bot_token, group_id, topic_id = load_telegram_config()
+    
+    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
     data = {
-        'chat_id': GROUP_ID,
+        'chat_id': group_id,
         'text': message,
         'parse_mode': 'HTML',
         'disable_web_page_preview': True
     }
     
-    if TOPIC_ID:
-        data['message_thread_id'] = TOPIC_ID
+    if topic_id:
+        data['message_thread_id'] = topic_id
     
     try:
         response = requests.post(url, json=data, timeout=10)
@@ -85,14 +106,14 @@ def send_deadline_alert(message):
         print(f"Error sending: {e}")
         return False
 
-def generate_weekly_report():
-    today = datetime.now()
+def generate_weekly_report(now=None):
+    today = now or datetime.now()
     
     print(f"\n{'='*60}")
     print(f"DEADLINE CHECK - {today.strftime('%Y-%m-%d %H:%M')}")
     print(f"{'='*60}")
     
-    top, medium, future = categorize_deadlines()
+    top, medium, future = categorize_deadlines(today.date())
     
     urgent_count = len(top)
     upcoming_count = len(medium)
@@ -104,40 +125,37 @@ def generate_weekly_report():
         return False
     
     today_str = today.strftime('%Y년 %m월 %d일')
+    weekday = _WEEKDAY_KO[today.weekday()]
     
-    message = f"""📅 <b>주간 대입 일정</b> ({today_str} 수요일)
-
-⚠️ <b>긴급 일정 (3주 이내)</b>
-"""
+    parts = [
+        f"📅 <b>주간 대입 일정</b> ({today_str} {weekday}요일)\n",
+        "\n⚠️ <b>긴급 일정 (3주 이내)</b>\n",
+    ]
     if top:
-        for d in sorted(top, key=lambda x: x['days']):
-            message += f"• {d['name']}: <b>{abs(d['days'])}일 후</b> ({d['date']})\n"
+        for d in sorted(top, key=attrgetter('days')):
+            parts.append(f"• {d.name}: <b>{abs(d.days)}일 후</b> ({d.date})\n")
     else:
-        message += "• 없음\n"
+        parts.append("• 없음\n")
     
-    message += f"""
-📌 <b>예정 일정 (4-8주 이내)</b>
-"""
+    parts.append("\n📌 <b>예정 일정 (4-8주 이내)</b>\n")
     if medium:
-        for d in sorted(medium, key=lambda x: x['days']):
-            message += f"• {d['name']}: {d['days']}일 후 ({d['date']})\n"
+        for d in sorted(medium, key=attrgetter('days')):
+            parts.append(f"• {d.name}: {d.days}일 후 ({d.date})\n")
     else:
-        message += "• 없음\n"
+        parts.append("• 없음\n")
     
-    message += """
-🔗 자세한 정보는 uni_monitoring.kr 참고
-
-#대입일정 #마감임박"""
+    parts.append("\n🔗 자세한 정보는 uni_monitoring.kr 참고\n\n#대입일정 #마감임박")
+    message = "".join(parts)
     
     return send_deadline_alert(message)
 
-def test_mode():
-    today = datetime.now()
+def test_mode(now=None):
+    today = now or datetime.now()
     print(f"\n{'='*60}")
     print(f"TEST MODE - {today.strftime('%Y-%m-%d %H:%M')}")
     print(f"{'='*60}")
     
-    top, medium, future = categorize_deadlines()
+    top, medium, future = categorize_deadlines(today.date())
     
     urgent_count = len(top)
     upcoming_count = len(medium)
@@ -148,26 +166,31 @@ def test_mode():
         print("No deadlines to report")
         return
     
-    print("\n📅 Would send:\n")
-    
     today_str = today.strftime('%Y년 %m월 %d일')
-    
-    print(f"📅 <b>주간 대입 일정</b> ({today_str} 수요일)")
-    print("\n⚠️ <b>긴급 일정 (3주 이내)</b>")
-    for d in sorted(top, key=lambda x: x['days']):
-        print(f"• {d['name']}: {abs(d['days'])}일 후 ({d['date']})")
-    
-    print("\n📌 <b>예정 일정 (4-8주 이내)</b>")
-    for d in sorted(medium, key=lambda x: x['days']):
-        print(f"• {d['name']}: {d['days']}일 후 ({d['date']})")
-    
-    print("\n🔗 #대입일정 #마감임박")
+    weekday = _WEEKDAY_KO[today.weekday()]
+    
+    lines = [
+        "\n📅 Would send:\n",
+        f"📅 <b>주간 대입 일정</b> ({today_str} {weekday}요일)",
+        "\n⚠️ <b>긴급 일정 (3주 이내)</b>",
+    ]
+    lines.extend(f"• {d.name}: {abs(d.days)}일 후 ({d.date})" for d in sorted(top, key=attrgetter('days')))
+    lines.append("\n📌 <b>예정 일정 (4-8주 이내)</b>")
+    lines.extend(f"• {d.name}: {d.days}일 후 ({d.date})" for d in sorted(medium, key=attrgetter('days')))
+    lines.append("\n🔗 #대입일정 #마감임박\n")
+    
+    # One write for the whole preview instead of a print per line
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 if __name__ == "__main__":
+    now = datetime.now()
     if len(sys.argv) > 1 and sys.argv[1] == '--test':
-        test_mode()
+        test_mode(now)
+    elif now.weekday() != WEDNESDAY and '--force' not in sys.argv:
+        print(f"Not Wednesday ({_WEEKDAY_KO[now.weekday()]}요일) - skipping weekly report (use --force to send anyway)")
     else:
-        if generate_weekly_report():
+        if generate_weekly_report(now):
             print("✅ Report sent to Education & Training topic")
         else:
             print("✗ Failed to send report")
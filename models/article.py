@@ -10,9 +10,13 @@ class Department(Enum):
     KOREAN = "korean"
     ENGLISH = "english"
     LIBERAL = "liberal"
+    GENERAL = "general"
     UNKNOWN = "unknown"
 
-@dataclass
+# Value -> member, so conversions are a dict lookup rather than Enum's call/ValueError path
+DEPARTMENT_BY_VALUE: Dict[str, Department] = {d.value: d for d in Department}
+
+@dataclass(slots=True)
 class Article:
     """Unified article data model"""
     title: str
@@ -55,5 +59,6 @@ class Article:
             source=data.get('source', ''),
             published_date=data.get('published_date'),
             department=data.get('department'),
-            metadata=data.get('metadata', {})
+            # Copy so the new Article never shares its metadata dict with the caller's data
+            metadata=dict(data.get('metadata') or {})
         )
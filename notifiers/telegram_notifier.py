@@ -1,8 +1,17 @@
+import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from typing import Optional
 
+# orjson encodes payloads faster and more compactly; json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class TelegramNotifier:
     def __init__(self, config: dict):
         self.bot_token = config.get('bot_token', '')
@@ -10,8 +19,52 @@ class TelegramNotifier:
         self.topics = config.get('topics', {})
         self.department_mapping = config.get('department_mapping', {})
         self.default_topic = config.get('default_topic', 'jobs_general')
+        # Minimum spacing between sends, to stay under Telegram's per-chat rate limit
+        self.min_send_interval = config.get('min_send_interval', 1.5)
+        self._last_send = 0.0
+        self._api_url = f"https://api.telegram.org/bot{self.bot_token}"
+        self._send_url = f"{self._api_url}/sendMessage"
+        # Fields that are the same for every message
+        self._base_payload = {
+            'chat_id': self.group_id,
+            'disable_web_page_preview': False
+        }
+        self._session = self._create_session()
         self.logger = logging.getLogger(__name__)
     
+    def _create_session(self) -> requests.Session:
+        """Keep-alive session so every send after the first reuses the TLS connection"""
+        session = requests.Session()
+        # Bodies are pre-encoded JSON (see _encode_payload)
+        session.headers['Content-Type'] = 'application/json'
+        # Only connection-level failures are retried here: a POST that reached
+        # Telegram is never resent blindly, and 429 is handled in send_message
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5),
+        )
+        session.mount('https://', adapter)
+        return session
+    
+    @staticmethod
+    def _encode_payload(payload: dict) -> bytes:
+        """Serialize a request body once, so a retry can resend the same bytes"""
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    def close(self):
+        """Release pooled connections"""
+        self._session.close()
+    
+    def _wait_for_send_slot(self):
+        """Sleep only for whatever is left of min_send_interval since the last send"""
+        remaining = self._last_send + self.min_send_interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._last_send = time.monotonic()
+    
     def _get_topic_id(self, department: str) -> Optional[int]:
         """Get topic thread ID for a department"""
         if not department:
@@ -45,20 +98,15 @@ class TelegramNotifier:
         if department:
             topic_id = self._get_topic_id(department)
         
-        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-        payload = {
-            'chat_id': self.group_id,
-            'text': message,
-            'parse_mode': parse_mode,
-            'disable_web_page_preview': False
-        }
+        payload = dict(self._base_payload, text=message, parse_mode=parse_mode)
         
         if topic_id:
             payload['message_thread_id'] = topic_id
+        body = self._encode_payload(payload)
         
         try:
-            response = requests.post(url, json=payload, timeout=10)
-            time.sleep(0.5)
+            self._wait_for_send_slot()
+            response = self._session.post(self._send_url, data=body, timeout=10)
             
             if response.status_code == 200:
                 self.logger.debug("Message sent successfully")
@@ -70,7 +118,8 @@ class TelegramNotifier:
                 self.logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
                 time.sleep(retry_after + 1)
                 
-                response2 = requests.post(url, json=payload, timeout=10)
+                self._last_send = time.monotonic()
+                response2 = self._session.post(self._send_url, data=body, timeout=10)
                 if response2.status_code == 200:
                     self.logger.info("Message sent after rate limit wait")
                     return True
@@ -88,8 +137,7 @@ class TelegramNotifier:
     def test_connection(self) -> bool:
         """Test Telegram bot connection"""
         try:
-            url = f"https://api.telegram.org/bot{self.bot_token}/getMe"
-            response = requests.get(url, timeout=5)
+            response = self._session.get(f"{self._api_url}/getMe", timeout=5)
             return response.status_code == 200
         except:
             return False
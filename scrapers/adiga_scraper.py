@@ -1,33 +1,57 @@
 """
 Adiga scraper with Selenium - clicks popup links to extract content
 """
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import time
 import re
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
 
-# Try importing from core, fallback if not available
-try:
-    from core.base_scraper import BaseScraper
-    from models.article import Article
-except ImportError:
-    # Fallback for standalone testing
-    class BaseScraper:
-        def __init__(self, config):
-            self.config = config
-            self.base_url = config.get('url', 'https://www.adiga.kr')
-            import requests
-            self.session = requests.Session()
-    
-    class Article:
-        def __init__(self, **kwargs):
-            self.__dict__.update(kwargs)
-            self.title = kwargs.get('title', '')
-            self.url = kwargs.get('url', '')
-            self.content = kwargs.get('content', '')
-            self.source = kwargs.get('source', '')
+from core.base_scraper import BaseScraper, HTML_PARSER
+from models.article import Article
+
+# Any of these keywords marks an article as admission-related
+ADMISSION_KEYWORDS = ['입학', '모집', '공고', '전형', '원서', '입시', '수시', '정시', '학과']
+_ADMISSION_RE = re.compile('|'.join(map(re.escape, ADMISSION_KEYWORDS)))
 
 class AdigaScraper(BaseScraper):
+    # Article ID inside a link's onclick="fnDetailPopup('12345')"
+    _FN_DETAIL_RE = re.compile(r'fnDetailPopup\s*\(\s*["\'](\d+)["\']\s*\)')
+    
+    # Collect onclick/title for every popup link in a single driver round trip
+    _LIST_POPUP_LINKS_JS = """
+        return Array.from(document.querySelectorAll("a[onclick*='fnDetailPopup']")).map(function (a) {
+            var titleElem = a.querySelector('.uctCastTitle');
+            return {onclick: a.getAttribute('onclick') || '', title: (titleElem || a).innerText || ''};
+        });
+    """
+    
+    # Return only the popup containers instead of serializing the whole page
+    _POPUP_HTML_JS = """
+        var html = [];
+        arguments[0].forEach(function (selector) {
+            var elem = document.querySelector(selector);
+            if (elem) { html.push(elem.outerHTML); }
+        });
+        return html;
+    """
+    
+    # Common popup selectors, in priority order (#newsPopCont is Adiga's news popup)
+    POPUP_SELECTORS = [
+        'div#newsPopCont',
+        'div.popCont',
+        'div.modal-body',
+        'div.popup-content',
+        'div#newsDetail',
+        'div.detail-content',
+    ]
+    
+    # Same budget as the fixed sleep this wait replaced, so a missed selector can't stall each article for long
+    POPUP_WAIT_SECONDS = 2
+    
     def __init__(self, config: Dict[str, Any]):
         if 'url' not in config:
             config['url'] = "https://www.adiga.kr"
@@ -71,6 +95,48 @@ class AdigaScraper(BaseScraper):
             traceback.print_exc()
             return False
     
+    def _fetch_popup_content(self, article_id: str) -> str:
+        """Open the article popup and extract its text"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        # Open the popup the same way the link's onclick does
+        self.driver.execute_script("fnDetailPopup(arguments[0]);", article_id)
+        
+        # Wait for popup to load
+        try:
+            WebDriverWait(self.driver, self.POPUP_WAIT_SECONDS).until(
+                EC.visibility_of_any_elements_located(
+                    (By.CSS_SELECTOR, ', '.join(self.POPUP_SELECTORS))
+                )
+            )
+        except TimeoutException:
+            print(f"       ⚠ No popup container visible after {self.POPUP_WAIT_SECONDS}s")
+        
+        # Extract content from the popup containers only
+        content = ""
+        for popup_html in self.driver.execute_script(self._POPUP_HTML_JS, self.POPUP_SELECTORS):
+            popup_elem = BeautifulSoup(popup_html, HTML_PARSER)
+            # Remove scripts and styles
+            for tag in popup_elem(['script', 'style']):
+                tag.decompose()
+            content = popup_elem.get_text(strip=True, separator=' ')[:500]
+            if content:
+                break
+        
+        # Close popup if there's a close button
+        try:
+            close_button = self.driver.find_element(By.XPATH, "//button[contains(@class, 'close') or contains(text(), '닫기')]")
+            close_button.click()
+            time.sleep(0.5)
+        except:
+            # Popup might auto-close or no close button
+            pass
+        
+        return content
+    
     def fetch_articles(self) -> List[Dict[str, Any]]:
         """Fetch articles by clicking popup links with Selenium"""
         print("=" * 80)
@@ -88,83 +154,53 @@ class AdigaScraper(BaseScraper):
             from selenium.webdriver.common.by import By
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException
             
             # Navigate to the news page
             url = "https://www.adiga.kr/uct/nmg/enw/newsView.do?menuId=PCUCTNMG2000"
             print(f"📋 Fetching: {url}")
             
             self.driver.get(url)
-            time.sleep(3)
+            
+            # Wait until the popup links are rendered instead of sleeping
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "a[onclick*='fnDetailPopup']"))
+                )
+            except TimeoutException:
+                print("   ⚠ Timed out waiting for popup links")
             
             print(f"   Status: Page loaded")
             
-            # Find all popup links
-            popup_links = self.driver.find_elements(By.XPATH, "//a[contains(@onclick, 'fnDetailPopup')]")
+            # Enumerate popup links on the browser side
+            popup_links = self.driver.execute_script(self._LIST_POPUP_LINKS_JS)
             print(f"   ✓ Found {len(popup_links)} popup links")
             
             # Process each link (limit to first 10 for testing)
             for idx, link in enumerate(popup_links[:10]):
                 try:
                     # Get article info before clicking
-                    onclick = link.get_attribute('onclick')
-                    match = re.search(r'fnDetailPopup\s*\(\s*["\'](\d+)["\']\s*\)', onclick)
+                    onclick = link['onclick']
+                    match = self._FN_DETAIL_RE.search(onclick)
                     if not match:
                         continue
                     
                     article_id = match.group(1)
-                    
-                    # Get title
-                    try:
-                        title_elem = link.find_element(By.CLASS_NAME, 'uctCastTitle')
-                        title = title_elem.text.strip()
-                    except:
-                        title = link.text.strip()
+                    title = link['title'].strip()
                     
                     if not title or len(title) < 5:
                         continue
                     
                     print(f"\n   [{idx+1}] Clicking: {title[:60]}... (ID: {article_id})")
                     
-                    # Click the link to open popup
-                    self.driver.execute_script("arguments[0].click();", link)
-                    time.sleep(2)  # Wait for popup to load
-                    
-                    # Extract content from popup
-                    page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
-                    
-                    # Look for popup content
-                    # Common popup selectors
-                    content = ""
-                    popup_selectors = [
-                        {'class': 'popCont'},
-                        {'class': 'modal-body'},
-                        {'class': 'popup-content'},
-                        {'id': 'newsDetail'},
-                        {'class': 'detail-content'},
-                    ]
-                    
-                    for selector in popup_selectors:
-                        popup_elem = soup.find('div', selector)
-                        if popup_elem:
-                            # Remove scripts and styles
-                            for tag in popup_elem(['script', 'style']):
-                                tag.decompose()
-                            content = popup_elem.get_text(strip=True, separator=' ')[:500]
-                            if content:
-                                break
+                    content = self._fetch_popup_content(article_id)
                     
                     if not content:
                         # Fallback: get any visible text that appeared after click
                         content = title
                     
                     # Check for admission keywords
-                    admission_keywords = ['입학', '모집', '공고', '전형', '원서', '입시', '수시', '정시', '학과']
-                    title_lower = title.lower()
-                    content_lower = content.lower()
-                    combined = title_lower + ' ' + content_lower
-                    
-                    is_admission = any(kw in combined for kw in admission_keywords)
+                    is_admission = bool(_ADMISSION_RE.search(title) or _ADMISSION_RE.search(content))
                     
                     if is_admission:
                         articles.append({
@@ -177,15 +213,6 @@ class AdigaScraper(BaseScraper):
                     else:
                         print(f"       ✗ Not admission-related")
                     
-                    # Close popup if there's a close button
-                    try:
-                        close_button = self.driver.find_element(By.XPATH, "//button[contains(@class, 'close') or contains(text(), '닫기')]")
-                        close_button.click()
-                        time.sleep(0.5)
-                    except:
-                        # Popup might auto-close or no close button
-                        pass
-                    
                 except Exception as e:
                     print(f"       Error processing link: {e}")
                     continue
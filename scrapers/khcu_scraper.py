@@ -4,32 +4,30 @@ Includes: Department filters, Item type filters, Exclusion patterns
 Threshold: 0.10 (10% keyword match confidence)
 """
 
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Sequence, Tuple
+from datetime import date, datetime
 
-try:
-    from core.base_scraper import BaseScraper
-    from models.article import Article
-except ImportError:
-    class BaseScraper:
-        def __init__(self, config):
-            self.config = config
-            self.logger = logging.getLogger(self.__class__.__name__)
-    
-    class Article:
-        def __init__(self, **kwargs):
-            self.__dict__.update(kwargs)
+# Selenium is imported where it is used so importing the module stays cheap
+if TYPE_CHECKING:
+    from selenium import webdriver
 
+from core.base_scraper import BaseScraper
+from models.article import Article
 
 logger = logging.getLogger(__name__)
 
+# Stray trailing characters left over from the schedule markup
+_TRAILING_LATIN_RE = re.compile(r'[a-zA-Z]+\s*$')
+_TRAILING_SLASH_RE = re.compile(r'[/\\]+\s*$')
+# "MM.DD" prefix of a schedule date
+_MONTH_DAY_RE = re.compile(r'(\d{2})\.(\d{2})')
+
 
 class FilterConfig:
     """Advanced filter configuration"""
@@ -84,6 +82,17 @@ class FilterConfig:
     }
 
 
+def _merge_keywords(entries: Dict[str, Dict[str, Any]]) -> Dict[str, Tuple[str, ...]]:
+    """Merge each entry's Korean and English keywords into one tuple"""
+    return {name: tuple(cfg['korean'] + cfg['english']) for name, cfg in entries.items()}
+
+
+# Merged once at import instead of on every keyword check
+DEPARTMENT_KEYWORDS = _merge_keywords(FilterConfig.DEPARTMENTS)
+ITEM_TYPE_KEYWORDS = _merge_keywords(FilterConfig.ITEM_TYPES)
+EXCLUDE_KEYWORDS = _merge_keywords(FilterConfig.EXCLUDE)
+
+
 class KhcuScraperAdvanced(BaseScraper):
     """KHCU Scraper with advanced multi-filter implementation"""
     
@@ -96,6 +105,9 @@ class KhcuScraperAdvanced(BaseScraper):
         
         # Date filtering
         self.date_filter_days = config.get('date_filter_days', 120)
+        # Fixed for the duration of a scrape() run; None means "ask the clock"
+        self._scrape_day: Optional[date] = None
+        self._scrape_ts: Optional[str] = None
         
         # Advanced filtering
         self.enable_department_filter = config.get('enable_department_filter', True)
@@ -109,9 +121,12 @@ class KhcuScraperAdvanced(BaseScraper):
         self.logger.info(f"  - Exclude: {self.enable_exclude_filter}")
         self.logger.info(f"  - Confidence threshold: {self.confidence_threshold * 100:.0f}%")
     
-    def _init_driver(self) -> webdriver.Chrome:
+    def _init_driver(self) -> "webdriver.Chrome":
         """Initialize Selenium Chrome driver"""
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            
             chrome_options = Options()
             chrome_options.add_argument("--headless")
             chrome_options.add_argument("--no-sandbox")
@@ -129,6 +144,10 @@ class KhcuScraperAdvanced(BaseScraper):
     def _load_page(self) -> bool:
         """Load KHCU schedule page"""
         try:
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            
             if not self.driver:
                 self.driver = self._init_driver()
             
@@ -152,28 +171,24 @@ class KhcuScraperAdvanced(BaseScraper):
             self.logger.error(f"Error loading page: {e}")
             return False
     
-    def _calculate_confidence(self, text: str, keywords: List[str]) -> Tuple[float, int]:
+    def _calculate_confidence(self, text_lower: str, keywords: Sequence[str]) -> Tuple[float, int]:
         """
-        Calculate confidence score for keyword matching
+        Calculate confidence score for keyword matching against lowercased text
         
         Returns: (confidence_score, match_count)
         """
-        text_lower = text.lower()
         matches = sum(1 for keyword in keywords if keyword in text_lower)
         confidence = matches / len(keywords) if keywords else 0
         
         return confidence, matches
     
-    def _check_department_match(self, text: str) -> Tuple[Optional[str], float]:
+    def _check_department_match(self, text_lower: str) -> Tuple[Optional[str], float]:
         """
-        Check if text matches any department
+        Check if lowercased text matches any department
         
         Returns: (department_name, confidence_score)
         """
-        text_lower = text.lower()
-        
-        for dept_name, dept_config in FilterConfig.DEPARTMENTS.items():
-            all_keywords = dept_config['korean'] + dept_config['english']
+        for dept_name, all_keywords in DEPARTMENT_KEYWORDS.items():
             confidence, matches = self._calculate_confidence(text_lower, all_keywords)
             
             if confidence >= self.confidence_threshold:
@@ -184,36 +199,30 @@ class KhcuScraperAdvanced(BaseScraper):
         
         return None, 0.0
     
-    def _check_item_type(self, text: str) -> Tuple[Optional[str], float]:
+    def _check_item_type(self, text_lower: str) -> Tuple[Optional[str], float]:
         """
-        Check what type of item this is
+        Check what type of item this lowercased text is
         
         Returns: (item_type, priority)
         """
-        text_lower = text.lower()
-        
-        for item_type, item_config in FilterConfig.ITEM_TYPES.items():
-            all_keywords = item_config['korean'] + item_config['english']
+        for item_type, all_keywords in ITEM_TYPE_KEYWORDS.items():
             confidence, matches = self._calculate_confidence(text_lower, all_keywords)
             
             if confidence >= self.confidence_threshold:
                 self.logger.debug(
                     f"Item type match '{item_type}': {matches}/{len(all_keywords)} keywords ({confidence*100:.0f}%)"
                 )
-                return item_type, item_config['priority']
+                return item_type, FilterConfig.ITEM_TYPES[item_type]['priority']
         
         return None, 999  # High number = low priority
     
-    def _check_exclude_patterns(self, text: str) -> bool:
+    def _check_exclude_patterns(self, text_lower: str) -> bool:
         """
-        Check if item should be excluded
+        Check if item should be excluded, given its lowercased text
         
         Returns: True if should be excluded, False otherwise
         """
-        text_lower = text.lower()
-        
-        for exclude_type, exclude_config in FilterConfig.EXCLUDE.items():
-            all_keywords = exclude_config['korean'] + exclude_config['english']
+        for exclude_type, all_keywords in EXCLUDE_KEYWORDS.items():
             confidence, matches = self._calculate_confidence(text_lower, all_keywords)
             
             if confidence >= self.confidence_threshold:
@@ -228,8 +237,8 @@ class KhcuScraperAdvanced(BaseScraper):
         """Clean title of stray characters"""
         if not title:
             return title
-        cleaned = re.sub(r'[a-zA-Z]+\s*$', '', title).strip()
-        cleaned = re.sub(r'[/\\]+\s*$', '', cleaned).strip()
+        cleaned = _TRAILING_LATIN_RE.sub('', title).strip()
+        cleaned = _TRAILING_SLASH_RE.sub('', cleaned).strip()
         return cleaned
     
     def _is_in_date_range(self, article_date: Optional[str]) -> bool:
@@ -238,10 +247,9 @@ class KhcuScraperAdvanced(BaseScraper):
             return False
         
         try:
-            article_dt = datetime.strptime(article_date, '%Y-%m-%d')
-            today = datetime.now()
-            future_cutoff = today + timedelta(days=self.date_filter_days)
-            return today.date() <= article_dt.date() <= future_cutoff.date()
+            today = self._scrape_day or date.today()
+            days_ahead = date.fromisoformat(article_date).toordinal() - today.toordinal()
+            return 0 <= days_ahead <= self.date_filter_days
         except Exception as e:
             self.logger.debug(f"Date check error: {e}")
             return False
@@ -254,6 +262,8 @@ class KhcuScraperAdvanced(BaseScraper):
             if not self._load_page():
                 return articles
             
+            from selenium.webdriver.common.by import By
+            
             schedule_items = self.driver.find_elements(By.CSS_SELECTOR, ".scheduleList > li")
             self.logger.info(f"Found {len(schedule_items)} total items on page")
             
@@ -294,12 +304,12 @@ class KhcuScraperAdvanced(BaseScraper):
     def _parse_date(self, date_text: str) -> Optional[str]:
         """Parse Korean date format to YYYY-MM-DD"""
         try:
-            match = re.match(r'(\d{2})\.(\d{2})', date_text)
+            match = _MONTH_DAY_RE.match(date_text)
             if not match:
                 return None
             
             month, day = int(match.group(1)), int(match.group(2))
-            year = datetime.now().year
+            year = (self._scrape_day or date.today()).year
             date_obj = datetime(year, month, day)
             return date_obj.strftime('%Y-%m-%d')
         except Exception as e:
@@ -308,58 +318,59 @@ class KhcuScraperAdvanced(BaseScraper):
     
     def parse_article(self, raw_data: Dict[str, Any]) -> Optional[Article]:
         """Parse article with advanced filtering"""
-        text = f"{raw_data.get('title', '')} {raw_data.get('content', '')}"
+        title = raw_data.get('title', '')
+        content = raw_data.get('content', '')
+        # Shortened title for the debug lines below
+        short_title = title[:50]
+        # Lowercase once and share it across every keyword check
+        text_lower = f"{title} {content}".lower()
         
         # Check exclusions first
-        if self.enable_exclude_filter and self._check_exclude_patterns(text):
-            self.logger.debug(f"Excluded (pattern match): {raw_data.get('title', '')[:50]}")
+        if self.enable_exclude_filter and self._check_exclude_patterns(text_lower):
+            self.logger.debug(f"Excluded (pattern match): {short_title}")
             return None
         
         # Check date range
         if not self._is_in_date_range(raw_data.get('published_date')):
-            self.logger.debug(f"Filtered (date range): {raw_data.get('title', '')[:50]}")
+            self.logger.debug(f"Filtered (date range): {short_title}")
             return None
         
-        # Check department match (optional)
-        department, dept_confidence = self._check_department_match(text)
-        
-        # Check item type (optional)
-        item_type, item_priority = self._check_item_type(text)
-        
-        # Decide if we should include this article
-        include = True
-        
         if self.enable_department_filter and self.enable_item_type_filter:
             # Strict: require BOTH department AND item type
-            include = (department is not None) and (item_type is not None)
             reason = "strict (dept + type)"
         elif self.enable_department_filter:
             # Only department filter
-            include = (department is not None)
             reason = "dept only"
         elif self.enable_item_type_filter:
             # Only item type filter
-            include = (item_type is not None)
             reason = "type only"
         else:
             # No filters - include all (except excluded/past)
             reason = "no filters"
         
-        if not include:
-            self.logger.debug(f"Filtered ({reason}): {raw_data.get('title', '')[:50]}")
+        # Check department match, stopping here if the filter requires one
+        department, dept_confidence = self._check_department_match(text_lower)
+        if self.enable_department_filter and department is None:
+            self.logger.debug(f"Filtered ({reason}): {short_title}")
+            return None
+        
+        # Check item type, stopping here if the filter requires one
+        item_type, item_priority = self._check_item_type(text_lower)
+        if self.enable_item_type_filter and item_type is None:
+            self.logger.debug(f"Filtered ({reason}): {short_title}")
             return None
         
         # Create article
         try:
             article = Article(
-                title=raw_data.get('title', ''),
+                title=title,
                 url=raw_data.get('url', ''),
-                content=raw_data.get('content', ''),
+                content=content,
                 source=self.source_name,
                 published_date=raw_data.get('published_date'),
                 department=department,
                 metadata={
-                    'fetched_at': datetime.now().isoformat(),
+                    'fetched_at': self._scrape_ts or datetime.now().isoformat(),
                     'source_name': self.source_name,
                     'date_text': raw_data.get('date_text'),
                     'item_type': item_type,
@@ -381,6 +392,10 @@ class KhcuScraperAdvanced(BaseScraper):
     
     def scrape(self) -> List[Article]:
         """Main scraping with advanced filtering"""
+        # One "today" for every date check and fetched_at stamp in this run
+        now = datetime.now()
+        self._scrape_day = now.date()
+        self._scrape_ts = now.isoformat()
         try:
             raw_articles = self.fetch_articles()
             articles = []
@@ -393,7 +408,7 @@ class KhcuScraperAdvanced(BaseScraper):
                 
                 if article is None:
                     # Count why it was filtered
-                    if self._check_exclude_patterns(f"{raw.get('title', '')} {raw.get('content', '')}"):
+                    if self._check_exclude_patterns(f"{raw.get('title', '')} {raw.get('content', '')}".lower()):
                         excluded_count += 1
                     else:
                         filtered_count += 1
@@ -413,6 +428,8 @@ class KhcuScraperAdvanced(BaseScraper):
             return []
         
         finally:
+            self._scrape_day = None
+            self._scrape_ts = None
             if self.driver:
                 try:
                     self.driver.quit()
@@ -6,17 +6,29 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.base_scraper import BaseScraper
+from core.base_scraper import BaseScraper, HTML_PARSER
 from models.article import Article
 from typing import List, Dict, Any
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 from datetime import datetime
 import time
 
 logger = logging.getLogger(__name__)
 
+# Only the job listing blocks are read from a results page
+JOB_ITEM_CLASSES = frozenset(['item_recruit', 'list_item'])
+
+def _has_job_item_class(class_value) -> bool:
+    """Match on individual class tokens, so class="item_recruit extra" is kept too"""
+    if not class_value:
+        return False
+    tokens = class_value.split() if isinstance(class_value, str) else class_value
+    return not JOB_ITEM_CLASSES.isdisjoint(tokens)
+
+JOB_ITEM_STRAINER = SoupStrainer(class_=_has_job_item_class)
+
 class SaraminScraper(BaseScraper):
     """
     Fetches job listings from Saramin search
@@ -42,9 +54,11 @@ class SaraminScraper(BaseScraper):
     def fetch_articles(self) -> List[Dict[str, Any]]:
         """Fetch all jobs from Saramin search"""
         all_jobs = []
+        # One date stamp for the whole run rather than a clock read per job
+        fetched_on = datetime.now().strftime('%Y-%m-%d')
         
         for page in range(1, self.max_pages + 1):
-            jobs = self._fetch_page(page)
+            jobs = self._fetch_page(page, fetched_on)
             if not jobs:
                 break
             all_jobs.extend(jobs)
@@ -54,7 +68,7 @@ class SaraminScraper(BaseScraper):
         logger.info(f"Total jobs fetched: {len(all_jobs)}")
         return all_jobs
     
-    def _fetch_page(self, page: int) -> List[Dict[str, Any]]:
+    def _fetch_page(self, page: int, fetched_on: str) -> List[Dict[str, Any]]:
         """Fetch a single page of search results"""
         try:
             params = {
@@ -70,12 +84,12 @@ class SaraminScraper(BaseScraper):
                 logger.warning(f"Page {page} failed: {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=JOB_ITEM_STRAINER)
             job_items = soup.select('.item_recruit') or soup.select('.list_item')
             
             jobs = []
             for job in job_items:
-                parsed = self._parse_job(job)
+                parsed = self._parse_job(job, fetched_on)
                 if parsed:
                     jobs.append(parsed)
             
@@ -85,7 +99,7 @@ class SaraminScraper(BaseScraper):
             logger.error(f"Error fetching page {page}: {e}")
             return []
     
-    def _parse_job(self, job_element) -> Dict[str, Any]:
+    def _parse_job(self, job_element, fetched_on: str) -> Dict[str, Any]:
         """Parse a single job listing into article format"""
         try:
             title_elem = job_element.select_one('.job_tit a, .title a')
@@ -121,7 +135,7 @@ class SaraminScraper(BaseScraper):
                 'company': company,
                 'location': location,
                 'requirements': requirements,
-                'published_date': datetime.now().strftime('%Y-%m-%d')
+                'published_date': fetched_on
             }
             
         except Exception as e:
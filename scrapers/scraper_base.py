@@ -34,12 +34,14 @@ class BaseScraper(ABC):
     
     def save_detected(self, programs):
         """Save detected programs to JSON file"""
+        state = {
+            'last_updated': datetime.now().isoformat(),
+            'source': self.source_name,
+            'programs': programs
+        }
+        # Machine-read state, so write it compactly
         with open(self.detected_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'last_updated': datetime.now().isoformat(),
-                'source': self.source_name,
-                'programs': programs
-            }, f, ensure_ascii=False, indent=2)
+            json.dump(state, f, ensure_ascii=False, separators=(',', ':'))
     
     def load_previous(self):
         """Load previously detected programs"""
@@ -51,8 +53,8 @@ class BaseScraper(ABC):
     def find_new_programs(self, current_programs):
         """Compare with previous runs to find new programs"""
         previous = self.load_previous()
-        previous_ids = {p['id'] for p in previous.get('programs', []) 
-                       if 'id' in p}
+        seen_ids = {p['id'] for p in previous.get('programs', []) 
+                    if 'id' in p}
         
         new_programs = []
         for program in current_programs:
@@ -60,7 +62,9 @@ class BaseScraper(ABC):
                 # Generate a simple ID if not provided
                 program['id'] = f"{self.source_name}_{hash(frozenset(program.items()))}"
             
-            if program['id'] not in previous_ids:
+            # Track IDs from this batch too, so a program listed twice is reported once
+            if program['id'] not in seen_ids:
+                seen_ids.add(program['id'])
                 new_programs.append(program)
         
         return new_programs
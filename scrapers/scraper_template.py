@@ -4,31 +4,35 @@ Template for new scraper implementations
 IMPORTANT: Before starting, read SCRAPER_DEVELOPMENT_GUIDE.md
 Complete the Pre-Development Checklist to identify website patterns.
 """
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 import time
 import re
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-# Core imports - try both paths for flexibility
-try:
-    from core.base_scraper import BaseScraper
-    from models.article import Article
-except ImportError:
-    # Fallback for standalone testing
-    class BaseScraper:
-        def __init__(self, config):
-            self.config = config
-            self.base_url = config.get('url', '')
-            import requests
-            self.session = requests.Session()
-    
-    class Article:
-        def __init__(self, **kwargs):
-            self.__dict__.update(kwargs)
+from core.base_scraper import BaseScraper, HTML_PARSER
+from models.article import Article
 
 logger = logging.getLogger(__name__)
 
+# TODO: Update selector for popup content
+POPUP_CONTENT_TAG = 'div'
+POPUP_CONTENT_CLASS = 'popup-content'
+
+def _has_popup_content_class(class_value) -> bool:
+    """Match on individual class tokens, so class="popup-content active" is kept too"""
+    if not class_value:
+        return False
+    tokens = class_value.split() if isinstance(class_value, str) else class_value
+    return POPUP_CONTENT_CLASS in tokens
+
+# Popup content container, as BeautifulSoup find()/SoupStrainer arguments
+POPUP_CONTENT_SELECTOR = {'name': POPUP_CONTENT_TAG, 'class_': _has_popup_content_class}
+
 class TemplateScraper(BaseScraper):
     """
     Template scraper for [SOURCE NAME]
@@ -178,7 +182,7 @@ class TemplateScraper(BaseScraper):
             if response.status_code != 200:
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             # TODO: Implement your parsing logic
             articles = []
@@ -214,7 +218,7 @@ class TemplateScraper(BaseScraper):
             
             # Get rendered HTML
             page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, HTML_PARSER)
             
             # TODO: Implement your parsing logic
             articles = []
@@ -231,7 +235,10 @@ class TemplateScraper(BaseScraper):
         Use when articles open in popups, not separate pages
         """
         from selenium.webdriver.common.by import By
-        from bs4 import BeautifulSoup
+        from bs4 import BeautifulSoup, SoupStrainer
+        
+        # Only the popup container is read, so skip building the rest of the page
+        popup_strainer = SoupStrainer(**POPUP_CONTENT_SELECTOR)
         
         if not self._init_selenium():
             return []
@@ -273,10 +280,9 @@ class TemplateScraper(BaseScraper):
                     
                     # Extract popup content
                     page_source = self.driver.page_source
-                    soup = BeautifulSoup(page_source, 'html.parser')
+                    soup = BeautifulSoup(page_source, HTML_PARSER, parse_only=popup_strainer)
                     
-                    # TODO: Update selector for popup content
-                    popup = soup.find('div', class_='popup-content')
+                    popup = soup.find(**POPUP_CONTENT_SELECTOR)
                     content = popup.get_text(strip=True) if popup else ""
                     
                     articles.append({
@@ -109,9 +109,6 @@ def get_music_types(text):
         if any(keyword in text_lower for keyword in config['keywords']):
             detected_types.append(type_id)
     
-    if not detected_types and any(word in text_lower for word in MUSIC_TYPES['general']['keywords']):
-        detected_types.append('general')
-    
     return detected_types
 
 def get_music_icons(type_ids):
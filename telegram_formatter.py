@@ -3,9 +3,9 @@
 Telegram formatter with better instructions for Adiga navigation
 """
 import requests
+from requests.adapters import HTTPAdapter
 import sys
 import os
-import html
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -17,48 +17,37 @@ except ImportError:
     BOT_TOKEN = None
     CHAT_ID = None
 
+# Shared keep-alive session so repeated sends reuse the TLS connection to api.telegram.org
+_TG_SESSION = requests.Session()
+_TG_SESSION.mount('https://', HTTPAdapter(pool_maxsize=10))
+
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+DEPARTMENT_EMOJIS = {
+    'music': '🎵',
+    'korean': '📚',
+    'english': '🔤',
+    'liberal': '📖',
+    'general': '🎓'
+}
+
 
 def escape_html(text):
-    """Escape HTML but don't double-escape existing entities"""
+    """Escape & < > " ' for Telegram's HTML parse mode"""
     if not text:
         return ""
     
-    import html
-    # html.escape converts: & -> &amp;, < -> &lt;, > -> &gt;, " -> &quot;, ' -> &#x27;
-    # But we don't want to escape & if it's part of an existing entity like &#x27;
-    
-    # Simple approach: only escape the bare minimum needed for Telegram
-    # Telegram HTML mode needs: < > & " '
-    # But ' can be &#x27; or &apos; or '
-    
-    # Actually, html.escape is fine, but we need to handle the case where
-    # text already contains HTML entities
-    text = str(text)
-    
-    # Replace & only if it's not part of an HTML entity
-    # This regex matches & that are not followed by # or word chars and ;
-    import re
-    # First escape < and >
-    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-    
-    # Handle quotes - but carefully
-    text = text.replace('"', '&quot;')
-    # For single quote, use &#x27; which is standard
-    text = text.replace("'", '&#x27;')
-    
-    return text
+    return str(text).translate(_HTML_ESCAPE_TABLE)
 
 
 def format_telegram_message(title, content, url, department="general", article_id=None):
-    department_emojis = {
-        'music': '🎵',
-        'korean': '📚', 
-        'english': '🔤',
-        'liberal': '📖',
-        'general': '🎓'
-    }
-    
-    emoji = department_emojis.get(department, '🎓')
+    emoji = DEPARTMENT_EMOJIS.get(department, '🎓')
     
     safe_title = escape_html(title)
     safe_content = escape_html(content)
@@ -68,32 +57,35 @@ def format_telegram_message(title, content, url, department="general", article_i
     if safe_content and len(safe_content) > 250:
         safe_content = safe_content[:250] + "..."
     
-    # Format message
-    message = f"{emoji} <b>[새 입학 공고] {safe_title}</b>\n\n"
+    # Format message: collect fragments and join once
+    parts = [f"{emoji} <b>[새 입학 공고] {safe_title}</b>\n\n"]
     
     if department != 'general':
         safe_department = escape_html(department)
-        message += f"📌 <b>부서/학과</b>: {safe_department}\n"
+        parts.append(f"📌 <b>부서/학과</b>: {safe_department}\n")
     
     if safe_content:
-        message += f"📝 <b>내용</b>: {safe_content}\n"
+        parts.append(f"📝 <b>내용</b>: {safe_content}\n")
     
-        message += f"🔗 <b>링크</b>: <a href=\"{safe_url}\">기사 보기</a>\n"
+        parts.append(f"🔗 <b>링크</b>: <a href=\"{safe_url}\">기사 보기</a>\n")
     
     # ADD NAVIGATION INSTRUCTIONS FOR ADIGA
     if article_id and 'adiga.kr' in url:
-        message += f"\n⚠ <b>Adiga.kr 페이지 안내:</b>\n"
-        message += f"1. 링크 클릭 후 페이지 로딩 대기\n"
-        message += f"2. '공통' 카테고리에서 기사 선택\n"
-        message += f"3. JavaScript가 활성화되어야 함\n"
-        message += f"4. 기사 ID: {article_id}\n"
+        parts.append(
+            f"\n⚠ <b>Adiga.kr 페이지 안내:</b>\n"
+            f"1. 링크 클릭 후 페이지 로딩 대기\n"
+            f"2. '공통' 카테고리에서 기사 선택\n"
+            f"3. JavaScript가 활성화되어야 함\n"
+            f"4. 기사 ID: {article_id}\n"
+        )
     
     # Add hashtags
-    message += f"\n#대학입시"
+    hashtags = ["#대학입시"]
     if department != 'general':
-        message += f" #{department}"
+        hashtags.append(f"#{department}")
+    parts.append("\n" + " ".join(hashtags))
     
-    return message
+    return "".join(parts)
 
 def format_program(program_data):
     # Use telegram_title if available (for Adiga compatibility)
@@ -121,7 +113,7 @@ def format_program(program_data):
     return format_telegram_message(title, content, url, department, article_id)
 
 
-def send_telegram_message(message, parse_mode="HTML"):
+def send_telegram_message(message, parse_mode="HTML", session=None):
     if not HAS_TELEGRAM_CONFIG:
         print("⚠ Telegram config not available")
         return False
@@ -139,7 +131,7 @@ def send_telegram_message(message, parse_mode="HTML"):
             "disable_web_page_preview": False
         }
         
-        response = requests.post(url, json=payload, timeout=10)
+        response = (session or _TG_SESSION).post(url, json=payload, timeout=10)
         
         if response.status_code == 200:
             print(f"✅ Telegram message sent successfully")
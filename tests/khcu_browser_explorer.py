@@ -12,7 +12,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 
-def explore_khcu():
+def explore_khcu(save_html: bool = False):
     """Explore KHCU site structure using Selenium"""
     
     print("🔍 KHCU Site Browser Exploration")
@@ -106,9 +106,6 @@ def explore_khcu():
         print("6️⃣  HTML Structure Analysis...")
         print("────────────────────────────────")
         
-        # Get page source
-        page_source = driver.page_source
-        
         # Count elements
         div_count = len(driver.find_elements(By.TAG_NAME, "div"))
         span_count = len(driver.find_elements(By.TAG_NAME, "span"))
@@ -119,17 +116,21 @@ def explore_khcu():
         print(f"   <p> elements: {p_count}")
         print("")
         
-        # Save full page source
-        with open("khcu_rendered.html", "w", encoding="utf-8") as f:
-            f.write(page_source)
-        print("7️⃣  Full rendered HTML saved to khcu_rendered.html")
-        print("")
+        # Save full page source only when asked for
+        if save_html:
+            with open("khcu_rendered.html", "wb") as f:
+                f.write(driver.page_source.encode("utf-8"))
+            print("7️⃣  Full rendered HTML saved to khcu_rendered.html")
+            print("")
         
         print("=" * 60)
         print("✅ Exploration complete!")
         print("")
         print("📋 Next steps:")
-        print("   1. Open khcu_rendered.html in your text editor")
+        if save_html:
+            print("   1. Open khcu_rendered.html in your text editor")
+        else:
+            print("   1. Re-run with --save-html and open khcu_rendered.html")
         print("   2. Look for:")
         print("      - How announcements are structured")
         print("      - What classes/IDs contain the content")
@@ -146,4 +147,8 @@ def explore_khcu():
             driver.quit()
 
 if __name__ == "__main__":
-    explore_khcu()
+    import argparse
+    parser = argparse.ArgumentParser(description='Explore the KHCU site structure')
+    parser.add_argument('--save-html', action='store_true', help='Save the rendered page to khcu_rendered.html')
+    args = parser.parse_args()
+    explore_khcu(save_html=args.save_html)